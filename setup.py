@@ -5,5 +5,8 @@ setup(
     version='0.1',
     packages=find_packages(),
     install_requires=[],
+    extras_require={
+        'async': ['aiobotocore']
+    },
     description='DevOps at work!'
 )
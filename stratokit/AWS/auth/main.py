@@ -1,61 +1,149 @@
+import logging
+import threading
+from collections import OrderedDict
+
 import boto3
+from botocore.config import Config
+
+__all__ = ['AWSClientCreator']
+
+log = logging.getLogger(__name__)
+
+
+def _default_config_options() -> dict:
+    """
+    Returns the default client settings shared by the sync and async clients: adaptive retries
+    (10 attempts), a pool of 50 connections and TCP keep-alive.
+    """
+
+    return {
+        'retries': {'mode': 'adaptive', 'max_attempts': 10},
+        'max_pool_connections': 50,
+        'tcp_keepalive': True
+    }
+
+
+def _credential_params(aws_access_key_id: str = None, aws_secret_access_key: str = None, aws_session_token: str = None) -> dict:
+    """
+    Returns the non-None credentials as client parameters. Partial credentials without both the
+    access key id and the secret key are dropped so the default credential chain is used instead.
+    """
+
+    credentials = {
+        k: v for k, v in (
+            ('aws_access_key_id', aws_access_key_id),
+            ('aws_secret_access_key', aws_secret_access_key),
+            ('aws_session_token', aws_session_token)
+        ) if v is not None
+    }
+
+    if 'aws_access_key_id' in credentials and 'aws_secret_access_key' in credentials:
+
+        return credentials
+
+    return {}
+
 
 class AWSClientCreator():
     """
     Class used to create AWS Boto3 clients for various AWS services.
+
+    Clients are created from a single boto3 Session owned by this creator and cached, so repeated
+    calls for the same service and credentials reuse the client and its connection pool. Boto3
+    clients are thread-safe to use, but Session client creation is not, so creation is guarded
+    by a lock.
+
+    The cache keeps the most recently used clients only. With rotating STS credentials every
+    rotation produces a new cache entry, and the least recently used entry is dropped once
+    max_cached_clients is reached. A dropped client is not closed because callers such as RDS
+    may still hold it; its connection pool is freed once no caller references it anymore.
+
+    Because the creator owns its Session, boto3.setup_default_session() does not affect it.
+    Pass profile_name to select a named profile instead.
     """
 
-    def __init__(self: object, aws_region: str = 'us-east-1') -> object:
+    __slots__ = ('region_name', 'profile_name', '_session', '_clients', '_max_cached_clients', '_lock')
+
+    def __init__(self: object, aws_region: str = 'us-east-1', profile_name: str = None, max_cached_clients: int = 16) -> object:
         """
         Initialize the AWSClientCreator with a default, or user based AWS region.
 
         Attributes:
             region_name (str): AWS region to use when creating clients. Default is 'us-east-1'.
+            profile_name (str): Named AWS profile for the Session. Default is the default credential chain.
+            max_cached_clients (int): Maximum number of clients kept in the cache. Default is 16.
         """
 
         self.region_name = aws_region
-
-        return None
+        self.profile_name = profile_name
+        self._session = boto3.session.Session(region_name=aws_region, profile_name=profile_name)
+        self._clients = OrderedDict()
+        self._max_cached_clients = max_cached_clients
+        self._lock = threading.Lock()
     
 
-    def create_client(self: object, service_name: str, aws_access_key_id: str = None, aws_secret_access_key = None, aws_session_token = None) -> object:
+    def create_client(self: object, service_name: str, aws_access_key_id: str = None, aws_secret_access_key = None, aws_session_token = None, config: Config = None, endpoint_url: str = None) -> object:
         """
-        Create a Boto3 client for the specified AWS service.
+        Create a Boto3 client for the specified AWS service, or return the cached one.
 
         Parameters:
             service_name (str): The name of the AWS service.
+            config (Config, optional): Botocore client configuration. Defaults to adaptive retries
+                                       (10 attempts), a pool of 50 connections and TCP keep-alive.
+                                       Botocore already pools connections per client, but TCP keep-alive
+                                       has to be enabled explicitly on older botocore releases.
+            endpoint_url (str, optional): Endpoint to pin the client to instead of the default regional one.
 
         Returns:
-            object: The Boto3 client for the requested service.
+            object: The Boto3 client for the requested service. Calls with the same service, credentials
+                    and config return the same client instance while it stays in the cache.
 
         Raises:
             Exception: If the client creation fails.
         """
 
+        key = (service_name, aws_access_key_id, aws_session_token, config, endpoint_url)
+
+        if config is None:
+
+            config = Config(**_default_config_options())
+
         params = {
             'service_name': service_name,
-            'region_name': self.region_name
+            'region_name': self.region_name,
+            'config': config
         }
 
-        if aws_access_key_id is not None and aws_secret_access_key is not None and aws_session_token is not None:
+        if endpoint_url is not None:
 
-            params['aws_access_key_id'] = aws_access_key_id
-            params['aws_secret_access_key'] = aws_secret_access_key
-            params['aws_session_token'] = aws_session_token
+            params['endpoint_url'] = endpoint_url
 
-        elif aws_access_key_id is not None and aws_secret_access_key is not None and aws_session_token is None:
+        params.update(_credential_params(aws_access_key_id, aws_secret_access_key, aws_session_token))
 
-            params['aws_access_key_id'] = aws_access_key_id
-            params['aws_secret_access_key'] = aws_secret_access_key
-            
         try:
 
-            client = boto3.client(**params)
+            with self._lock:
+
+                client = self._clients.get(key)
+
+                if client is None:
+
+                    client = self._session.client(**params)
+
+                    self._clients[key] = client
+
+                    if len(self._clients) > self._max_cached_clients:
+
+                        self._clients.popitem(last=False)
+
+                else:
+
+                    self._clients.move_to_end(key)
 
             return client
         
         except Exception as e:
 
-            print(f'Error creating the AWS service client for "{service_name}": {e}')
+            log.error('Error creating the AWS service client for "%s": %s', service_name, e)
             
             raise
@@ -1 +1,13 @@
-from .main import *
\ No newline at end of file
+from .main import *
+
+try:
+
+    from .async_main import *
+
+except ModuleNotFoundError as e:
+
+    # aiobotocore is optional; install stratokit[async] to use AsyncRDS. Any other missing
+    # module is a real error and must not silently hide AsyncRDS.
+    if e.name is None or not e.name.startswith('aiobotocore'):
+
+        raise
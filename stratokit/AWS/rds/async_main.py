@@ -0,0 +1,467 @@
+import asyncio
+import functools
+import logging
+from secrets import token_hex
+
+from aiobotocore.config import AioConfig
+from aiobotocore.session import AioSession
+from botocore.exceptions import ClientError
+
+from ..auth.main import _credential_params, _default_config_options
+from .main import _THROTTLE_MAX_ATTEMPTS, _throttle_backoff, _ThrottleProxy
+
+__all__ = ['AsyncRDS']
+
+log = logging.getLogger(__name__)
+
+
+def _retry_throttled_async(fn):
+    """
+    Async counterpart of _retry_throttled: retries a coroutine call failing with a throttling
+    error, awaiting the same jittered exponential backoff between attempts.
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+
+        for attempt in range(_THROTTLE_MAX_ATTEMPTS):
+
+            try:
+
+                return await fn(*args, **kwargs)
+
+            except ClientError as e:
+
+                delay = _throttle_backoff(e, attempt)
+
+                if delay is None:
+
+                    raise
+
+                log.warning("Throttled on %s, retrying in %.1fs: %s", fn.__name__, delay, e)
+
+                await asyncio.sleep(delay)
+
+    return wrapper
+
+
+class _AsyncThrottleProxy(_ThrottleProxy):
+    """
+    Wraps an aiobotocore client so that its describe_* and modify_* calls are retried on throttling.
+    """
+
+    __slots__ = ()
+
+    _retry = staticmethod(_retry_throttled_async)
+
+
+class AsyncRDS():
+    """
+    Asynchronous counterpart of RDS backed by aiobotocore.
+
+    Every wait is awaited instead of blocking a thread, so many orchestrations can share a
+    single event loop. Use it as an async context manager and fan out with asyncio.gather:
+
+        async with AsyncRDS(aws_client) as rds:
+
+            await asyncio.gather(*[rds.restore_rds_cluster_from_snapshot(**params) for params in restores])
+
+    The client uses the creator's region and profile, the same default retry and pool settings
+    and the same credential handling as AWSClientCreator.create_client, and its describe_* and
+    modify_* calls retry on throttling like RDS. Each context opens its own aiobotocore client,
+    so the creator's cache of sync clients is not shared.
+    """
+
+    __slots__ = ('_client_context', '_rds_client')
+
+    def __init__(self: object, aws_client: object, credentials: dict = None) -> None:
+        """
+        Prepare the aiobotocore RDS client. The client is opened when entering the context manager.
+
+        Parameters:
+            aws_client (AWSClientCreator): Client creator whose region and profile are used for the RDS client.
+            credentials (dict, optional): aws_access_key_id, aws_secret_access_key and aws_session_token,
+                        plus optional config (AioConfig) and endpoint_url, as accepted by create_client.
+
+        Attributes:
+            rds_client: aiobotocore RDS client, available inside the async context.
+        """
+
+        options = {}
+
+        if credentials is not None:
+
+            options = dict(credentials)
+
+        config = options.pop('config', None)
+        endpoint_url = options.pop('endpoint_url', None)
+
+        if config is None:
+
+            config = AioConfig(**_default_config_options())
+
+        params = _credential_params(**options)
+
+        params['service_name'] = 'rds'
+        params['region_name'] = aws_client.region_name
+        params['config'] = config
+
+        if endpoint_url is not None:
+
+            params['endpoint_url'] = endpoint_url
+
+        self._client_context = AioSession(profile=aws_client.profile_name).create_client(**params)
+        self._rds_client = None
+
+
+    async def __aenter__(self: object) -> object:
+
+        self._rds_client = _AsyncThrottleProxy(await self._client_context.__aenter__())
+
+        return self
+
+
+    async def __aexit__(self: object, exc_type: type, exc: Exception, tb: object) -> None:
+
+        await self._client_context.__aexit__(exc_type, exc, tb)
+
+        self._rds_client = None
+
+
+    async def _is_cluster_snapshot_ready(self: object, snapshot_id: str, waiter_delay: int = 30, waiter_max_attempts: int = 120) -> None:
+        """
+        Wait until an RDS cluster snapshot is finished (status == 'available').
+
+        Parameters:
+            snapshot_id (str): DBClusterSnapshotIdentifier to check.
+            waiter_delay (int): Seconds between status checks. Default is 30.
+            waiter_max_attempts (int): Maximum number of status checks before giving up. Default is 120.
+
+        Raises:
+            Exception: If snapshot creation fails.
+        """
+
+        try:
+
+            waiter = self._rds_client.get_waiter('db_cluster_snapshot_available')
+
+            await waiter.wait(DBClusterSnapshotIdentifier=snapshot_id, WaiterConfig={'Delay': waiter_delay, 'MaxAttempts': waiter_max_attempts})
+
+            log.info("Snapshot '%s' is now available.", snapshot_id)
+
+        except Exception as e:
+
+            log.error("Error while trying to get RDS Cluster Snapshot: %s", e)
+
+            raise
+
+
+    async def _share_rds_snapshot(self: object, snapshot_id: str, destination_account_id: str) -> dict:
+        """
+        Shares a manual Amazon RDS snapshot with another AWS account.
+
+        Parameters:
+            snapshot_id (str): The identifier of the RDS snapshot to be shared.
+            destination_account_id (str): The AWS account ID with which to share the snapshot.
+
+        Returns:
+            dict: AWS response of the snapshot attribute modification.
+
+        Raises:
+            Exception: If the snapshot cannot be shared.
+        """
+
+        try:
+
+            response = await self._rds_client.modify_db_cluster_snapshot_attribute(DBClusterSnapshotIdentifier=snapshot_id, AttributeName='restore', ValuesToAdd=[destination_account_id])
+
+            log.info("Snapshot %s shared with the AWS account %s", snapshot_id, destination_account_id)
+
+            return response
+
+        except Exception as e:
+
+            log.error("Error while trying to share snapshot: %s", e)
+
+            raise
+
+
+    async def _is_cluster_restored(self: object, db_cluster_identifier: str, waiter_delay: int = 30, waiter_max_attempts: int = 120) -> None:
+        """
+        Wait until the RDS cluster restored from a snapshot is in 'available' status.
+
+        Parameters:
+            db_cluster_identifier (str): Identifier of the cluster being restored.
+            waiter_delay (int): Seconds between status checks. Default is 30.
+            waiter_max_attempts (int): Maximum number of status checks before giving up. Default is 120.
+
+        Raises:
+            Exception: If AWS call fails.
+        """
+
+        try:
+
+            waiter = self._rds_client.get_waiter('db_cluster_available')
+
+            await waiter.wait(DBClusterIdentifier=db_cluster_identifier, WaiterConfig={'Delay': waiter_delay, 'MaxAttempts': waiter_max_attempts})
+
+            log.info("Cluster '%s' is now available.", db_cluster_identifier)
+
+        except Exception as e:
+
+            log.error("Unexpected error happened while trying to reach the restored cluster status: %s", e)
+
+            raise
+
+
+    async def _is_instance_available(self: object, db_instance_identifier: str, waiter_delay: int = 30, waiter_max_attempts: int = 120) -> None:
+        """
+        Waits until the RDS DB instance is available.
+
+        Parameters:
+            db_instance_identifier (str): Identifier of the DB instance to check.
+            waiter_delay (int): Seconds between status checks. Default is 30.
+            waiter_max_attempts (int): Maximum number of status checks before giving up. Default is 120.
+
+        Raises:
+            Exception: If an AWS error occurs.
+        """
+
+        try:
+
+            waiter = self._rds_client.get_waiter('db_instance_available')
+
+            await waiter.wait(DBInstanceIdentifier=db_instance_identifier, WaiterConfig={'Delay': waiter_delay, 'MaxAttempts': waiter_max_attempts})
+
+            log.info("Instance '%s' is now available.", db_instance_identifier)
+
+        except Exception as e:
+
+            log.error("Error checking DB instance status: %s", e)
+
+            raise
+
+
+    async def create_rds_cluster_snapshot(self: object, cluster_id: str, snapshot_identifier: str, snapshot_shared_account: str = None, waiter_delay: int = 30, waiter_max_attempts: int = 120) -> None:
+        """
+        Creates a snapshot of an RDS cluster.
+
+        Parameters:
+            cluster_id (str): The identifier of the RDS cluster.
+            snapshot_identifier (str): Custom identifier for the snapshot.
+            snapshot_shared_account (str): AWS account ID that the snapshot will be shared with.
+            waiter_delay (int, optional): Seconds between status checks while waiting. Default is 30.
+            waiter_max_attempts (int, optional): Maximum number of status checks before giving up. Default is 120.
+
+        Returns:
+            None
+
+        Raises:
+            Exception: If snapshot creation fails.
+        """
+
+        try:
+
+            await self._rds_client.create_db_cluster_snapshot(
+                DBClusterIdentifier=cluster_id,
+                DBClusterSnapshotIdentifier=snapshot_identifier
+            )
+
+            await self._is_cluster_snapshot_ready(snapshot_id=snapshot_identifier, waiter_delay=waiter_delay, waiter_max_attempts=waiter_max_attempts)
+
+            log.info("Cluster snapshot '%s' created successfully for cluster '%s'.", snapshot_identifier, cluster_id)
+
+            if snapshot_shared_account is not None:
+
+                await self._share_rds_snapshot(snapshot_id=snapshot_identifier, destination_account_id=snapshot_shared_account)
+
+        except Exception as e:
+
+            log.error("Failed to create cluster snapshot: %s", e)
+
+            raise
+
+
+    async def restore_rds_cluster_from_snapshot(self: object,
+                                                db_cluster_identifier: str,
+                                                snapshot_identifier: str,
+                                                engine: str,
+                                                db_cluster_instance_class: str,
+                                                db_subnet_group: str,
+                                                vpc_security_group_ids: list,
+                                                kms_key_id: str = None,
+                                                reset_master_password: bool = False,
+                                                waiter_delay: int = 30,
+                                                waiter_max_attempts: int = 120) -> tuple:
+        """
+        Restore an RDS cluster from a snapshot and create an associated DB instance.
+
+        Parameters:
+            db_cluster_identifier (str): The identifier for the new restored cluster.
+            engine (str): The engine used by the RDS cluster.
+            db_cluster_instance_class (str): Instance class for the DB instance (e.g., 'db.r5.large').
+            db_subnet_group (str): Name of the DB subnet group.
+            vpc_security_group_ids (list): List of security group IDs.
+            kms_key_id (str, optional): KMS key ARN/ID to use for encryption.
+            reset_master_password (bool, optional): If you want to create a Secret Manager with the master credentials.
+            waiter_delay (int, optional): Seconds between status checks while waiting. Default is 30.
+            waiter_max_attempts (int, optional): Maximum number of status checks before giving up. Default is 120.
+
+        Returns:
+            tuple: The restored cluster identifier and the created instance identifier.
+
+        Raises:
+            Exception: If restore or instance creation fails.
+        """
+
+        rds = self._rds_client
+
+        params = {
+
+            'DBClusterIdentifier': db_cluster_identifier,
+            'SnapshotIdentifier': snapshot_identifier,
+            'DBClusterInstanceClass': db_cluster_instance_class,
+            'DBSubnetGroupName': db_subnet_group,
+            'VpcSecurityGroupIds': vpc_security_group_ids,
+            'Engine': engine
+
+        }
+
+        if kms_key_id is not None:
+
+            params['KmsKeyId'] = kms_key_id
+
+        try:
+
+            await rds.restore_db_cluster_from_snapshot(**params)
+
+            await self._is_cluster_restored(db_cluster_identifier=db_cluster_identifier, waiter_delay=waiter_delay, waiter_max_attempts=waiter_max_attempts)
+
+            if reset_master_password:
+
+                await rds.modify_db_cluster(DBClusterIdentifier=db_cluster_identifier, ManageMasterUserPassword=True, ApplyImmediately=True)
+
+            log.info("Cluster snapshot '%s' restored successfully for cluster '%s'.", snapshot_identifier, db_cluster_identifier)
+
+            instance_params = {
+
+                'db_name': db_cluster_identifier,
+                'instance_type': db_cluster_instance_class,
+                'engine': engine,
+                'waiter_delay': waiter_delay,
+                'waiter_max_attempts': waiter_max_attempts
+
+            }
+
+            cluster_name = db_cluster_identifier
+            instance_name = await self.create_db_instance(**instance_params)
+
+            return cluster_name, instance_name
+
+        except Exception as e:
+
+            log.error("Failed to restore cluster based in the snapshot: %s", e)
+
+            raise
+
+
+    async def create_db_instance(self: object, db_name: str, instance_type: str, engine: str, waiter_delay: int = 30, waiter_max_attempts: int = 120) -> str:
+        """
+        Creates a new RDS database instance in the specified cluster.
+
+        Parameters:
+            db_name (str): The identifier of the database cluster.
+            instance_type (str): The instance class for the new database instance.
+            engine: (str): The database engine that are going to be used (Ex: Postgres, MySQL, etc...)
+            waiter_delay (int, optional): Seconds between status checks while waiting. Default is 30.
+            waiter_max_attempts (int, optional): Maximum number of status checks before giving up. Default is 120.
+
+        Returns:
+            str: The identifier of the created instance.
+
+        Raises:
+            Exception: If restore or instance creation fails.
+        """
+
+        instance_name = f"{db_name}-{token_hex(3)}"
+
+        try:
+
+            await self._rds_client.create_db_instance(
+                DBInstanceIdentifier=instance_name,
+                DBInstanceClass=instance_type,
+                Engine=engine,
+                DBClusterIdentifier=db_name,
+            )
+
+            await self._is_instance_available(db_instance_identifier=instance_name, waiter_delay=waiter_delay, waiter_max_attempts=waiter_max_attempts)
+
+            log.info('New database instance created in the %s: %s', db_name, instance_name)
+
+        except Exception as e:
+
+            log.error("Error while creating RDS instance %s: %s", instance_name, e)
+
+            raise
+
+        return instance_name
+
+
+    async def delete_db_instance(self: object, instance_name: str) -> None:
+        """
+        Deletes the specified RDS database instance.
+
+        Parameters:
+            instance_name (str): The identifier of the database instance to delete.
+
+        Returns:
+            None.
+
+        Raises:
+            Exception: If the deletion request fails.
+        """
+
+        try:
+
+            await self._rds_client.delete_db_instance(
+                DBInstanceIdentifier=instance_name,
+                SkipFinalSnapshot=True
+            )
+
+            log.info('The AWS RDS Cluster Database %s is being deleted...', instance_name)
+
+        except Exception as e:
+
+            log.error("Error while trying to delete te RDS instance %s: %s", instance_name, e)
+
+            raise
+
+
+    async def delete_rds_cluster(self: object, cluster_identifier: str) -> None:
+        """
+        Deletes an Amazon RDS cluster (e.g., Aurora).
+
+        Parameters:
+            cluster_identifier (str): The RDS cluster identifier.
+
+        Returns:
+            None.
+
+        Raises:
+            Exception: If the deletion request fails.
+        """
+
+        try:
+
+            await self._rds_client.delete_db_cluster(
+                DBClusterIdentifier=cluster_identifier,
+                SkipFinalSnapshot=True
+            )
+
+            log.info('The AWS RDS Cluster %s is being deleted...', cluster_identifier)
+
+        except Exception as e:
+
+            log.error("Error deleting RDS cluster: %s", e)
+
+            raise
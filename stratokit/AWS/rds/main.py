@@ -1,8 +1,101 @@
+import functools
+import logging
+import random
 import time
-import uuid
+from secrets import token_hex
+from typing import Iterator
+
+import jmespath
+from botocore.exceptions import ClientError
+
+__all__ = ['RDS']
+
+log = logging.getLogger(__name__)
+
+_THROTTLING_ERROR_CODES = frozenset({'Throttling', 'ThrottlingException', 'RequestLimitExceeded'})
+
+_THROTTLE_MAX_ATTEMPTS = 10
+
+_INSTANCE_STATUSES = jmespath.compile('DBInstances[].[DBInstanceIdentifier, DBInstanceStatus]')
+
+_CLUSTER_STATUSES = jmespath.compile('DBClusters[].[DBClusterIdentifier, Status]')
+
+
+def _throttle_backoff(error: ClientError, attempt: int) -> float:
+    """
+    Returns the jittered exponential backoff before retrying a throttled call, or None when the
+    error is not a throttling error or no attempts are left.
+    """
+
+    if error.response.get('Error', {}).get('Code') not in _THROTTLING_ERROR_CODES or attempt == _THROTTLE_MAX_ATTEMPTS - 1:
+
+        return None
+
+    return random.uniform(0, min(60, 0.5 * 2 ** attempt))
+
+
+def _retry_throttled(fn):
+    """
+    Decorator that retries a boto3 call failing with a throttling error, sleeping with
+    jittered exponential backoff between attempts. Any other error is raised immediately.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+
+        for attempt in range(_THROTTLE_MAX_ATTEMPTS):
+
+            try:
+
+                return fn(*args, **kwargs)
+
+            except ClientError as e:
+
+                delay = _throttle_backoff(e, attempt)
+
+                if delay is None:
+
+                    raise
+
+                log.warning("Throttled on %s, retrying in %.1fs: %s", fn.__name__, delay, e)
+
+                time.sleep(delay)
+
+    return wrapper
+
+
+class _ThrottleProxy():
+    """
+    Wraps a Boto3 client so that its describe_* and modify_* calls are retried on throttling.
+
+    Paginators and waiters are returned from the wrapped client untouched and rely on the
+    client's own retry configuration.
+    """
+
+    __slots__ = ('_client',)
+
+    _retry = staticmethod(_retry_throttled)
+
+    def __init__(self: object, client: object) -> None:
+
+        self._client = client
+
+
+    def __getattr__(self: object, name: str) -> object:
+
+        attr = getattr(self._client, name)
+
+        if name.startswith(('describe_', 'modify_')) and callable(attr):
+
+            return self._retry(attr)
+
+        return attr
+
 
 class RDS():
 
+    __slots__ = ('_rds_client',)
+
     def __init__(self: object, aws_client: object, credentials: dict = None) -> None:
         """
         A class to manage AWS RDS database instances and clusters.
@@ -23,17 +116,17 @@ class RDS():
 
         params['service_name'] = 'rds'
 
-        self._rds_client = aws_client.create_client(**params)
-
-        return None
+        self._rds_client = _ThrottleProxy(aws_client.create_client(**params))
     
 
-    def _is_cluster_snapshot_ready(self: object, snapshot_id: str) -> None:
+    def _is_cluster_snapshot_ready(self: object, snapshot_id: str, waiter_delay: int = 30, waiter_max_attempts: int = 120) -> None:
         """
         Check whether an RDS cluster snapshot is finished (status == 'available').
 
         Parameters:
             snapshot_id (str): DBClusterSnapshotIdentifier to check.
+            waiter_delay (int): Seconds between status checks. Default is 30.
+            waiter_max_attempts (int): Maximum number of status checks before giving up. Default is 120.
 
         Raises:
             Exception: If snapshot creation fails.
@@ -42,37 +135,20 @@ class RDS():
 
         try:
 
-            while True:
-                
-                resp = self._rds_client.describe_db_cluster_snapshots(DBClusterSnapshotIdentifier=snapshot_id)
-                snapshots = resp.get('DBClusterSnapshots', [])
-
-                if not snapshots:
-                    
-                    raise ValueError(f"Snapshot '{snapshot_id}' not found.")
+            waiter = self._rds_client.get_waiter('db_cluster_snapshot_available')
 
-                status = snapshots[0]['Status']
-                
-                print(f"Snapshot '{snapshot_id}' status: {status}")
-
-                if status == 'available':
-                    
-                    print("Snapshot is now available.")
-                    
-                    break
+            waiter.wait(DBClusterSnapshotIdentifier=snapshot_id, WaiterConfig={'Delay': waiter_delay, 'MaxAttempts': waiter_max_attempts})
 
-                time.sleep(60)
+            log.info("Snapshot '%s' is now available.", snapshot_id)
 
         except Exception as e:
 
-            print(f"Error while trying to get RDS Cluster Snapshot: {e}")
+            log.error("Error while trying to get RDS Cluster Snapshot: %s", e)
 
             raise
 
-        return None
-
     
-    def _share_rds_snapshot(self: object, snapshot_id: str, destination_account_id: str) -> None:
+    def _share_rds_snapshot(self: object, snapshot_id: str, destination_account_id: str) -> dict:
         """
         Shares a manual Amazon RDS snapshot with another AWS account.
 
@@ -81,7 +157,10 @@ class RDS():
             destination_account_id (str): The AWS account ID with which to share the snapshot.
 
         Returns:
-            None
+            dict: AWS response of the snapshot attribute modification.
+
+        Raises:
+            Exception: If the snapshot cannot be shared.
 
         """
 
@@ -89,23 +168,25 @@ class RDS():
 
             response = self._rds_client.modify_db_cluster_snapshot_attribute(DBClusterSnapshotIdentifier=snapshot_id, AttributeName='restore', ValuesToAdd=[destination_account_id])
             
-            print(f"Snapshot {snapshot_id} shared with the AWS account {destination_account_id}")
+            log.info("Snapshot %s shared with the AWS account %s", snapshot_id, destination_account_id)
             
             return response
         
         except Exception as e:
         
-            print(f"Error while trying to share snapshot: {e}")
-        
-        return None
+            log.error("Error while trying to share snapshot: %s", e)
+
+            raise
     
     
-    def _is_cluster_restored(self:object, db_cluster_identifier: str) -> None:
+    def _is_cluster_restored(self:object, db_cluster_identifier: str, waiter_delay: int = 30, waiter_max_attempts: int = 120) -> None:
         """
         Check whether the RDS cluster restored from a snapshot is in 'available' status.
 
         Parameters:
             db_cluster_identifier (str): Identifier of the cluster being restored.
+            waiter_delay (int): Seconds between status checks. Default is 30.
+            waiter_max_attempts (int): Maximum number of status checks before giving up. Default is 120.
 
         Returns:
             None.
@@ -114,47 +195,29 @@ class RDS():
             Exception: If AWS call fails.
         """
 
-        rds = self._rds_client
-
         try:
 
-            while True:
-
-                response = rds.describe_db_clusters(DBClusterIdentifier=db_cluster_identifier)
-
-                clusters = response.get("DBClusters", [])
+            waiter = self._rds_client.get_waiter('db_cluster_available')
 
-                if not clusters:
+            waiter.wait(DBClusterIdentifier=db_cluster_identifier, WaiterConfig={'Delay': waiter_delay, 'MaxAttempts': waiter_max_attempts})
 
-                    raise ValueError(f"Cluster '{db_cluster_identifier}' not found.")
-
-                status = clusters[0]['Status']
-
-                print(f"Cluster {db_cluster_identifier} status: {status}")
-
-                if status == 'available':
-
-                    print("Cluster is now available.")
-
-                    break
-
-                time.sleep(60)
+            log.info("Cluster '%s' is now available.", db_cluster_identifier)
 
         except Exception as e:
 
-            print(f"Unexpected error happened while trying to reach the restored cluster status: {e}")
+            log.error("Unexpected error happened while trying to reach the restored cluster status: %s", e)
 
             raise
 
-        return None
-
 
-    def _is_instance_available(self: object, db_instance_identifier: str) -> None:
+    def _is_instance_available(self: object, db_instance_identifier: str, waiter_delay: int = 30, waiter_max_attempts: int = 120) -> None:
         """
         Waits until the RDS DB instance is available.
 
         Parameters:
             db_instance_identifier (str): Identifier of the DB instance to check.
+            waiter_delay (int): Seconds between status checks. Default is 30.
+            waiter_max_attempts (int): Maximum number of status checks before giving up. Default is 120.
 
         Returns:
             None
@@ -163,92 +226,176 @@ class RDS():
             Exception: If an AWS error occurs.
         """
 
-        rds = self._rds_client
-
         try:
-            
-            while True:
-                
-                response = rds.describe_db_instances(DBInstanceIdentifier=db_instance_identifier)
-                
-                instances = response.get("DBInstances", [])
 
-                if not instances:
-                
-                    raise ValueError(f"No DB instance found with identifier '{db_instance_identifier}'.")
+            waiter = self._rds_client.get_waiter('db_instance_available')
 
-                status = instances[0]['DBInstanceStatus']
-                
-                print(f"Instance '{db_instance_identifier}' status: {status}")
+            waiter.wait(DBInstanceIdentifier=db_instance_identifier, WaiterConfig={'Delay': waiter_delay, 'MaxAttempts': waiter_max_attempts})
 
-                if status == 'available':
-                
-                    print(f"Instance '{db_instance_identifier}' is now available.")
-                
-                    break
-
-                time.sleep(60)
+            log.info("Instance '%s' is now available.", db_instance_identifier)
 
         except Exception as e:
             
-            print(f"Error checking DB instance status: {e}")
+            log.error("Error checking DB instance status: %s", e)
             
             raise
-
-        return None
     
 
-    def find_snapshots_by_partial_name(self: object, partial_name: str, cluster: bool = False) -> list:
+    def iter_snapshots_by_partial_name(self: object, partial_name: str, cluster: bool = False, exact: bool = False) -> Iterator[dict]:
 
         """
-        Searches for RDS snapshots (standard or cluster) whose identifiers contain a given partial name.
+        Lazily yields RDS snapshots (standard or cluster) whose identifiers contain a given partial name.
+
+        Pages are only requested from AWS as the generator is consumed, so stopping early skips the
+        remaining pages. The substring search lists every snapshot visible to the account. On accounts
+        with a large number of snapshots prefer exact=True, or tag the snapshots and look them up with
+        resourcegroupstaggingapi.get_resources, which does not scale with the snapshot count.
 
         Parameters:
             partial_name (str): Substring to search for in the snapshot identifiers.
             cluster (bool): If True, searches DB cluster snapshots (e.g., Aurora). 
                         If False, searches standard DB instance snapshots.
+            exact (bool): If True, partial_name is treated as the full snapshot identifier and
+                        looked up directly instead of listing all snapshots.
 
-        Returns:
-            list: A list of snapshot names that match the search criteria.
-
-        Raises:
-            Exception: If an AWS error occurs.
+        Yields:
+            dict: Each snapshot that matches the search criteria.
         """
 
-        snapshots = []
-
         rds = self._rds_client
 
+        # RDS stores snapshot identifiers in lowercase and JMESPath has no lowercase function,
+        # so lowering the needle alone keeps the search case-insensitive.
+        needle = partial_name.lower().replace("'", "\\'")
+
         try:
 
             if cluster:
 
-                response = rds.describe_db_cluster_snapshots(IncludeShared=True)
+                operation = 'describe_db_cluster_snapshots'
                 key = 'DBClusterSnapshots'
                 id_key = 'DBClusterSnapshotIdentifier'
+                not_found = rds.exceptions.DBClusterSnapshotNotFoundFault
 
             else:
                 
-                response = rds.describe_db_snapshots(IncludeShared=True)
+                operation = 'describe_db_snapshots'
                 key = 'DBSnapshots'
                 id_key = 'DBSnapshotIdentifier'
+                not_found = rds.exceptions.DBSnapshotNotFoundFault
 
-            for snapshot in response.get(key, []):
-                
-                snapshot_id = snapshot.get(id_key, '')
+            if exact:
+
+                try:
+
+                    response = getattr(rds, operation)(**{id_key: partial_name})
+
+                except not_found:
+
+                    return
 
-                if partial_name.lower() in snapshot_id.lower():
-                    
-                    snapshots.append(snapshot)
+                yield from response.get(key, [])
+
+                return
+
+            paginator = rds.get_paginator(operation)
+
+            pages = paginator.paginate(IncludeShared=True, PaginationConfig={'PageSize': 100})
+
+            yield from pages.search(f"{key}[?contains({id_key}, '{needle}')]")
 
         except Exception as e:
 
-            print(f"Error while searching for snapshots: {e}")
+            log.error("Error while searching for snapshots: %s", e)
+
 
-        return snapshots
+    def find_snapshots_by_partial_name(self: object, partial_name: str, cluster: bool = False, exact: bool = False) -> list:
+        """
+        Searches for RDS snapshots (standard or cluster) whose identifiers contain a given partial name.
+
+        Parameters:
+            partial_name (str): Substring to search for in the snapshot identifiers.
+            cluster (bool): If True, searches DB cluster snapshots (e.g., Aurora). 
+                        If False, searches standard DB instance snapshots.
+            exact (bool): If True, partial_name is treated as the full snapshot identifier.
+
+        Returns:
+            list: A list of snapshot names that match the search criteria.
+        """
+
+        return list(self.iter_snapshots_by_partial_name(partial_name=partial_name, cluster=cluster, exact=exact))
 
 
-    def create_rds_cluster_snapshot(self: object, cluster_id: str, snapshot_identifier: str, snapshot_shared_account: str = None) -> None:
+    def find_snapshot(self: object, partial_name: str, cluster: bool = False, exact: bool = False) -> dict:
+        """
+        Returns the first RDS snapshot (standard or cluster) whose identifier contains a given partial name.
+
+        Stops paginating as soon as a match is found.
+
+        Parameters:
+            partial_name (str): Substring to search for in the snapshot identifiers.
+            cluster (bool): If True, searches DB cluster snapshots (e.g., Aurora). 
+                        If False, searches standard DB instance snapshots.
+            exact (bool): If True, partial_name is treated as the full snapshot identifier.
+
+        Returns:
+            dict: The first matching snapshot, or None if there is no match.
+        """
+
+        return next(self.iter_snapshots_by_partial_name(partial_name=partial_name, cluster=cluster, exact=exact), None)
+
+
+    def bulk_statuses(self: object, kind: str = 'instance') -> dict:
+        """
+        Retrieves the status of every RDS DB instance or cluster in the region in one paginated listing.
+
+        Use this when watching several resources at once instead of describing each one per poll.
+
+        Parameters:
+            kind (str): 'instance' for DB instances or 'cluster' for DB clusters. Default is 'instance'.
+
+        Returns:
+            dict: Mapping of resource identifier to its current status.
+
+        Raises:
+            ValueError: If kind is not 'instance' or 'cluster'.
+            Exception: If an AWS error occurs.
+        """
+
+        if kind == 'instance':
+
+            operation = 'describe_db_instances'
+            expression = _INSTANCE_STATUSES
+
+        elif kind == 'cluster':
+
+            operation = 'describe_db_clusters'
+            expression = _CLUSTER_STATUSES
+
+        else:
+
+            raise ValueError(f"Unsupported kind '{kind}', expected 'instance' or 'cluster'.")
+
+        statuses = {}
+
+        try:
+
+            paginator = self._rds_client.get_paginator(operation)
+
+            for page in paginator.paginate(PaginationConfig={'PageSize': 100}):
+
+                statuses.update(expression.search(page) or [])
+
+        except Exception as e:
+
+            log.error("Error while listing RDS %s statuses: %s", kind, e)
+
+            raise
+
+        return statuses
+
+
+    def create_rds_cluster_snapshot(self: object, cluster_id: str, snapshot_identifier: str, snapshot_shared_account: str = None, waiter_delay: int = 30, waiter_max_attempts: int = 120) -> None:
         """
         Creates a snapshot of an RDS cluster.
 
@@ -256,6 +403,8 @@ class RDS():
             cluster_id (str): The identifier of the RDS cluster.
             snapshot_identifier (str): Custom identifier for the snapshot.
             snapshot_shared_account (str): AWS account ID that the snapshot will be shared with.
+            waiter_delay (int, optional): Seconds between status checks while waiting. Default is 30.
+            waiter_max_attempts (int, optional): Maximum number of status checks before giving up. Default is 120.
         
         Returns:
             dict: AWS response containing details of the created cluster snapshot.
@@ -271,19 +420,17 @@ class RDS():
                 DBClusterSnapshotIdentifier=snapshot_identifier
             )
 
-            self._is_cluster_snapshot_ready(snapshot_id=snapshot_identifier)
+            self._is_cluster_snapshot_ready(snapshot_id=snapshot_identifier, waiter_delay=waiter_delay, waiter_max_attempts=waiter_max_attempts)
 
-            print(f"Cluster snapshot '{snapshot_identifier}' created successfully for cluster '{cluster_id}'.")
+            log.info("Cluster snapshot '%s' created successfully for cluster '%s'.", snapshot_identifier, cluster_id)
 
             if snapshot_shared_account is not None:
 
                 self._share_rds_snapshot(snapshot_id=snapshot_identifier, destination_account_id=snapshot_shared_account)
 
-            return None
-
         except Exception as e:
 
-            print(f"Failed to create cluster snapshot: {e}")
+            log.error("Failed to create cluster snapshot: %s", e)
 
             raise
         
@@ -296,7 +443,9 @@ class RDS():
                                           db_subnet_group: str, 
                                           vpc_security_group_ids: list,
                                           kms_key_id: str = None,
-                                          reset_master_password: bool = False) -> None:
+                                          reset_master_password: bool = False,
+                                          waiter_delay: int = 30,
+                                          waiter_max_attempts: int = 120) -> None:
         """
         Restore an RDS cluster from a snapshot and create an associated DB instance.
 
@@ -308,6 +457,8 @@ class RDS():
             vpc_security_group_ids (list): List of security group IDs.
             kms_key_id (str, optional): KMS key ARN/ID to use for encryption.
             reset_master_password (bool, optional): If you want to create a Secret Manager with the master credentials.
+            waiter_delay (int, optional): Seconds between status checks while waiting. Default is 30.
+            waiter_max_attempts (int, optional): Maximum number of status checks before giving up. Default is 120.
 
         Returns:
             None
@@ -337,19 +488,21 @@ class RDS():
 
             rds.restore_db_cluster_from_snapshot(**params)
 
-            self._is_cluster_restored(db_cluster_identifier=db_cluster_identifier)
+            self._is_cluster_restored(db_cluster_identifier=db_cluster_identifier, waiter_delay=waiter_delay, waiter_max_attempts=waiter_max_attempts)
 
             if reset_master_password:
 
                 rds.modify_db_cluster(DBClusterIdentifier=db_cluster_identifier, ManageMasterUserPassword=True, ApplyImmediately=True)
             
-            print(f"Cluster snapshot '{snapshot_identifier}' restored successfully for cluster '{db_cluster_identifier}'.")
+            log.info("Cluster snapshot '%s' restored successfully for cluster '%s'.", snapshot_identifier, db_cluster_identifier)
 
             instance_params = {
 
                 'db_name': db_cluster_identifier,
                 'instance_type': db_cluster_instance_class,
-                'engine': engine
+                'engine': engine,
+                'waiter_delay': waiter_delay,
+                'waiter_max_attempts': waiter_max_attempts
 
             }
 
@@ -360,12 +513,12 @@ class RDS():
         
         except Exception as e:
 
-            print(f"Failed to restore cluster based in the snapshot: {e}")
+            log.error("Failed to restore cluster based in the snapshot: %s", e)
 
             raise
 
     
-    def create_db_instance(self: object, db_name: str, instance_type: str, engine: str) -> None: 
+    def create_db_instance(self: object, db_name: str, instance_type: str, engine: str, waiter_delay: int = 30, waiter_max_attempts: int = 120) -> None: 
         """
         Creates a new RDS database instance in the specified cluster.
 
@@ -373,6 +526,8 @@ class RDS():
             db_name (str): The identifier of the database cluster.
             instance_type (str): The instance class for the new database instance.
             engine: (str): The database engine that are going to be used (Ex: Postgres, MySQL, etc...)
+            waiter_delay (int, optional): Seconds between status checks while waiting. Default is 30.
+            waiter_max_attempts (int, optional): Maximum number of status checks before giving up. Default is 120.
 
         Returns:
             None
@@ -381,8 +536,7 @@ class RDS():
             Exception: If restore or instance creation fails.
         """
 
-        uuid_hex = uuid.uuid4().hex[:5]
-        instance_name = f"{db_name}-{uuid_hex}"
+        instance_name = f"{db_name}-{token_hex(3)}"
 
         try:
 
@@ -393,13 +547,13 @@ class RDS():
                 DBClusterIdentifier=db_name,
             )
 
-            self._is_instance_available(db_instance_identifier=instance_name)
+            self._is_instance_available(db_instance_identifier=instance_name, waiter_delay=waiter_delay, waiter_max_attempts=waiter_max_attempts)
             
-            print(f'New database instance created in the {db_name}: {instance_name}')
+            log.info('New database instance created in the %s: %s', db_name, instance_name)
 
         except Exception as e:
 
-            print(f"Error while creating RDS instance {instance_name}: {e}")
+            log.error("Error while creating RDS instance %s: %s", instance_name, e)
             
             raise
 
@@ -427,15 +581,13 @@ class RDS():
                 SkipFinalSnapshot=True
             )
 
-            print(f'The AWS RDS Cluster Database {instance_name} is being deleted...')
+            log.info('The AWS RDS Cluster Database %s is being deleted...', instance_name)
 
         except Exception as e:
             
-            print(f"Error while trying to delete te RDS instance {instance_name}: {e}")
+            log.error("Error while trying to delete te RDS instance %s: %s", instance_name, e)
             
             raise
-
-        return None
     
 
     def delete_rds_cluster(self: object, cluster_identifier: str) -> None:
@@ -461,12 +613,10 @@ class RDS():
                 SkipFinalSnapshot=True
             )
 
-            print(f'The AWS RDS Cluster {cluster_identifier} is being deleted...')
-            
-            return None
+            log.info('The AWS RDS Cluster %s is being deleted...', cluster_identifier)
 
         except Exception as e:
 
-            print(f"Error deleting RDS cluster: {e}")
+            log.error("Error deleting RDS cluster: %s", e)
 
             raise